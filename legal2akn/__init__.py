@@ -1,8 +1,31 @@
 """Legal2AKN - Convert legal documents to Akoma Ntoso XML format."""
 
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .converter import AkomaNtosoConverter
+    from .models import LegalDocument, DocumentMetadata
+
 __version__ = "0.1.0"
 
-from .converter import AkomaNtosoConverter
-from .models import LegalDocument, DocumentMetadata
+# Public names and the modules they live in; imported on first access so
+# that importing the package (e.g. for the CLI) does not pull in lxml
+_LAZY_IMPORTS = {
+    "AkomaNtosoConverter": ".converter",
+    "LegalDocument": ".models",
+    "DocumentMetadata": ".models",
+}
+
+__all__ = ["AkomaNtosoConverter", "LegalDocument", "DocumentMetadata"]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["AkomaNtosoConverter", "LegalDocument", "DocumentMetadata"]
\ No newline at end of file
+def __dir__():
+    return sorted(list(globals()) + __all__)
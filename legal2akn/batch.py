@@ -0,0 +1,111 @@
+"""Batch conversion of many legal documents in parallel."""
+
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Union
+
+from .converter import AkomaNtosoConverter
+from .parser import DocumentParser
+from .pdf_parser import PDFParser
+from .models import DocumentMetadata, LegalDocument, Section
+from .pool import run_in_processes
+
+
+# Parser and converter hold no per-document state; one of each per process
+_PARSER = DocumentParser()
+_CONVERTER = AkomaNtosoConverter()
+
+
+def _output_path(input_file: Path, out_dir: Path) -> Path:
+    """Return the XML file convert_file writes for input_file."""
+    return Path(out_dir) / f"{Path(input_file).stem}.xml"
+
+
+def convert_file(
+    input_file: Path,
+    out_dir: Path,
+    doc_type: str = "act",
+    country: str = "US",
+    language: str = "eng",
+    parse: bool = True
+) -> Path:
+    """
+    Convert a single PDF or text file and write the XML into out_dir.
+    
+    Args:
+        input_file: Path to the PDF or plain text document
+        out_dir: Directory to write the XML file to
+        doc_type: Document type (act, bill, constitution, etc.)
+        country: Country code
+        language: Language code
+        parse: Whether to parse the document structure
+    
+    Returns:
+        Path of the written XML file
+    """
+    input_file = Path(input_file)
+    if input_file.suffix.lower() == '.pdf':
+        content = PDFParser().parse_pdf_fast(input_file)
+    else:
+        content = input_file.read_text(encoding='utf-8')
+    
+    metadata = DocumentMetadata(
+        title=input_file.stem,
+        document_type=doc_type,
+        country=country,
+        language=language
+    )
+    
+    if parse:
+        document = _PARSER.parse(content, metadata)
+    else:
+        document = LegalDocument(
+            metadata=metadata,
+            sections=[Section(id="sec_1", number="1", content=content)]
+        )
+    
+    output = _output_path(input_file, out_dir)
+    _CONVERTER.to_file(document, output)
+    return output
+
+
+def convert_many(
+    paths: Iterable[Path],
+    out_dir: Path,
+    workers: Optional[int] = None,
+    **options
+) -> Dict[Path, Union[Path, Exception]]:
+    """
+    Convert many documents in parallel across a pool of worker processes.
+    
+    Args:
+        paths: Input PDF or text files
+        out_dir: Directory to write the XML files to (created if missing)
+        workers: Number of worker processes (defaults to the CPU count)
+        **options: Passed through to convert_file (doc_type, country, language, parse)
+    
+    Returns:
+        Mapping of each input path to its output path, or to the exception
+        raised while converting it
+    
+    Raises:
+        ValueError: If two inputs share a stem (a/doc.pdf and b/doc.txt) and
+            would write the same XML file
+    """
+    out_dir = Path(out_dir)
+    paths = list(dict.fromkeys(Path(path) for path in paths))
+    
+    # Check before starting any work, as clashing inputs would overwrite
+    # each other's output, possibly from two workers at once
+    inputs_by_output = {}
+    for path in paths:
+        inputs_by_output.setdefault(_output_path(path, out_dir), []).append(path)
+    clashes = [inputs for inputs in inputs_by_output.values() if len(inputs) > 1]
+    if clashes:
+        raise ValueError(
+            "Inputs would write the same output file: "
+            + "; ".join(", ".join(str(path) for path in inputs) for inputs in clashes)
+        )
+    
+    out_dir.mkdir(parents=True, exist_ok=True)
+    
+    return run_in_processes(convert_file, paths, workers, out_dir=out_dir, **options)
@@ -1,26 +1,47 @@
 """Command-line interface for legal2akn."""
 
 import sys
+import glob
 import json
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime
 
 import click
 from rich.console import Console
-from rich.panel import Panel
-from rich.syntax import Syntax
 
-from .converter import AkomaNtosoConverter
 from .parser import DocumentParser
-from .pdf_parser import PDFParser
 from .models import DocumentMetadata, LegalDocument
 
 
 console = Console()
 
+# Inputs larger than this (in characters) are written with the streaming XML writer
+STREAMING_THRESHOLD = 1_000_000
 
-@click.command()
+# Previews larger than this (in characters) are printed without syntax highlighting
+PREVIEW_HIGHLIGHT_LIMIT = 256_000
+
+
+class DefaultCommandGroup(click.Group):
+    """Command group that runs the convert command when no subcommand is named."""
+    
+    def parse_args(self, ctx, args):
+        if args and args[0] not in self.commands and args[0] not in ctx.help_option_names:
+            args.insert(0, 'convert')
+        return super().parse_args(ctx, args)
+
+
+@click.group(cls=DefaultCommandGroup)
+def main():
+    """
+    Convert legal documents to Akoma Ntoso XML format.
+    
+    Runs the convert command unless another command is named.
+    """
+
+
+@main.command()
 @click.argument('input_file', type=click.Path(exists=True, path_type=Path))
 @click.option('-o', '--output', type=click.Path(path_type=Path), help='Output XML file path')
 @click.option('-t', '--title', help='Document title')
@@ -29,9 +50,10 @@ console = Console()
 @click.option('--language', default='eng', help='Language code (e.g., eng, fra, esp)')
 @click.option('--parse', is_flag=True, help='Parse plain text document structure')
 @click.option('--json', 'as_json', is_flag=True, help='Input is JSON format')
+@click.option('--markdown', is_flag=True, help='Extract PDF text via pymupdf4llm markdown conversion')
 @click.option('--preview', is_flag=True, help='Preview output without saving')
 @click.option('--verbose', is_flag=True, help='Show detailed processing information')
-def main(
+def convert(
     input_file: Path,
     output: Optional[Path],
     title: Optional[str],
@@ -40,11 +62,12 @@ def main(
     language: str,
     parse: bool,
     as_json: bool,
+    markdown: bool,
     preview: bool,
     verbose: bool
 ):
     """
-    Convert legal documents to Akoma Ntoso XML format.
+    Convert a legal document to Akoma Ntoso XML format.
     
     Example usage:
     
@@ -58,16 +81,27 @@ def main(
             if verbose:
                 console.print(f"[blue]Processing PDF file:[/blue] {input_file}")
             
-            pdf_parser = PDFParser()
-            markdown_content, structure_info = pdf_parser.parse_pdf_to_text(input_file)
+            from .pdf_parser import PDFParser
             
-            # Clean markdown for text parsing
-            content = pdf_parser.clean_text(markdown_content)
+            pdf_parser = PDFParser()
+            if markdown:
+                markdown_content, structure_info = pdf_parser.parse_pdf_to_text(input_file)
+                
+                # Clean markdown for text parsing
+                content = pdf_parser.clean_text(markdown_content)
+            else:
+                content = pdf_parser.parse_pdf_fast(input_file)
+                
+                # Headings are only shown in verbose mode; read them from the PDF directly
+                structure_info = pdf_parser.extract_structure_from_pdf(input_file) if verbose else {}
             
             if verbose:
-                console.print(f"[green]Extracted text from PDF using pymupdf4llm[/green]")
-                console.print(f"[dim]Found {len(structure_info.get('parts', []))} parts[/dim]")
-                console.print(f"[dim]Found {len(structure_info.get('articles', []))} articles[/dim]")
+                if markdown:
+                    console.print(f"[green]Extracted text from PDF using pymupdf4llm[/green]")
+                    console.print(f"[dim]Found {len(structure_info.get('parts', []))} parts[/dim]")
+                    console.print(f"[dim]Found {len(structure_info.get('articles', []))} articles[/dim]")
+                else:
+                    console.print(f"[green]Extracted text from PDF using PyMuPDF[/green]")
                 
                 # Show parts found
                 if structure_info.get('parts'):
@@ -120,21 +154,37 @@ def main(
                 console.print("[yellow]Created simple document (use --parse for structure extraction)[/yellow]")
         
         # Convert to Akoma Ntoso XML
+        from .converter import AkomaNtosoConverter
+        
         converter = AkomaNtosoConverter()
-        xml_string = converter.to_string(document, pretty_print=True)
+        show_preview = preview or not output
         
         # Output handling
-        if preview or not output:
-            # Show preview
+        if show_preview:
+            # Show preview; only what is shown on screen is indented
+            xml_string = converter.to_pretty_string(document)
             console.print("\n[bold blue]Akoma Ntoso XML Output:[/bold blue]")
-            syntax = Syntax(xml_string, "xml", theme="monokai", line_numbers=True)
-            console.print(Panel(syntax, expand=False))
+            if len(xml_string) > PREVIEW_HIGHLIGHT_LIMIT:
+                # Syntax highlighting re-lexes every line; print large output as is
+                sys.stdout.flush()
+                sys.stdout.buffer.write(xml_string.encode('utf-8'))
+                sys.stdout.flush()
+            else:
+                from rich.panel import Panel
+                from rich.syntax import Syntax
+                
+                syntax = Syntax(xml_string, "xml", theme="monokai", line_numbers=True)
+                console.print(Panel(syntax, expand=False))
             
             if not output and not preview:
                 console.print("\n[yellow]Use -o/--output to save to file[/yellow]")
         
         if output:
-            output.write_text(xml_string, encoding='utf-8')
+            # Saved files are always compact, with or without --preview
+            if len(content) > STREAMING_THRESHOLD:
+                converter.to_file_streaming(document, output)
+            else:
+                output.write_text(converter.to_string(document), encoding='utf-8')
             console.print(f"\n[green]Success:[/green] XML saved to: {output}")
         
     except FileNotFoundError:
@@ -151,6 +201,64 @@ def main(
         sys.exit(1)
 
 
+@main.command()
+@click.argument('patterns', nargs=-1, required=True)
+@click.option('-o', '--output-dir', type=click.Path(file_okay=False, path_type=Path), required=True, help='Directory for the XML files')
+@click.option('--type', 'doc_type', default='act', help='Document type (act, bill, judgment, etc.)')
+@click.option('--country', default='US', help='Country code (e.g., US, UK, CA)')
+@click.option('--language', default='eng', help='Language code (e.g., eng, fra, esp)')
+@click.option('--parse', is_flag=True, help='Parse plain text document structure')
+@click.option('--workers', type=int, help='Number of worker processes (default: CPU count)')
+def batch(
+    patterns: Tuple[str, ...],
+    output_dir: Path,
+    doc_type: str,
+    country: str,
+    language: str,
+    parse: bool,
+    workers: Optional[int]
+):
+    """
+    Convert many PDF or text documents in parallel.
+    
+    Example usage:
+    
+        legal2akn batch "tests/input/*.pdf" -o tests/output --parse
+    """
+    from .batch import convert_many
+    
+    paths = sorted({Path(p) for pattern in patterns for p in glob.glob(pattern, recursive=True)})
+    if not paths:
+        console.print(f"[red]Error:[/red] No files match: {' '.join(patterns)}")
+        sys.exit(1)
+    
+    try:
+        results = convert_many(
+            paths,
+            output_dir,
+            workers=workers,
+            doc_type=doc_type,
+            country=country,
+            language=language,
+            parse=parse
+        )
+    except ValueError as e:
+        console.print(f"[red]Error:[/red] {e}")
+        sys.exit(1)
+    
+    failures = 0
+    for path, result in results.items():
+        if isinstance(result, Exception):
+            failures += 1
+            console.print(f"[red]Error:[/red] {path}: {result}")
+        else:
+            console.print(f"[green]Success:[/green] {path} -> {result}")
+    
+    if failures:
+        console.print(f"\n[red]{failures} of {len(results)} documents failed[/red]")
+        sys.exit(1)
+
+
 def _print_structure_summary(document: LegalDocument):
     """Print a summary of the document structure."""
     summary = []
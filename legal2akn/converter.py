@@ -1,25 +1,158 @@
 """Core converter for transforming legal documents to Akoma Ntoso XML."""
 
-from typing import Optional, Union
+import os
+import re
+from functools import lru_cache
+from typing import List, Optional, Union
 from pathlib import Path
 from lxml import etree
 from datetime import datetime
+from xml.sax.saxutils import escape
 
 from .models import LegalDocument, Part, Chapter, Article, Section, DocumentMetadata
 
 
+# Metadata block rendered as a single fragment and parsed once per document
+_META_TEMPLATE = (
+    '<meta>'
+    '<identification source="#source">'
+    '<FRBRWork>'
+    '<FRBRthis value="{work_this}"/>'
+    '<FRBRuri value="{work_uri}"/>'
+    '{work_date}'
+    '<FRBRauthor href="{author}"/>'
+    '<FRBRcountry value="{country}"/>'
+    '</FRBRWork>'
+    '<FRBRExpression>'
+    '<FRBRthis value="{expr_this}"/>'
+    '<FRBRuri value="{expr_uri}"/>'
+    '{work_date}'
+    '<FRBRauthor href="{author}"/>'
+    '<FRBRlanguage language="{language}"/>'
+    '</FRBRExpression>'
+    '<FRBRManifestation>'
+    '<FRBRthis value="{manif_this}"/>'
+    '<FRBRuri value="{manif_uri}"/>'
+    '<FRBRdate date="{manif_date}"/>'
+    '<FRBRauthor href="#legal2akn"/>'
+    '</FRBRManifestation>'
+    '</identification>'
+    '<references>{organization}</references>'
+    '</meta>'
+)
+
+_TLC_ORGANIZATION_TEMPLATE = (
+    '<TLCOrganization eId="{publisher}" '
+    'href="/ontology/organization/{country}/{publisher}" '
+    'showAs="{publisher}"/>'
+)
+
+
+# Same entities lxml writes for attribute values
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+_XML_DECLARATION = "<?xml version='1.0' encoding='UTF-8'?>\n"
+
+# Characters lxml refuses in attribute values, and its message for them
+_INVALID_XML_CHAR_RE = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f\ud800-\udfff\ufffe\uffff]')
+_INVALID_XML_MESSAGE = "All strings must be XML compatible: Unicode or ASCII, no NULL bytes or control characters"
+
+# Text entities beyond &, < and >: lxml writes \r as a character reference,
+# and a literal one would be folded into \n when the fragment is parsed
+_TEXT_ENTITIES = {"\r": "&#13;"}
+
+# Section leaves are rendered as bytes and parsed once per parent
+_SECTION_TEMPLATE = (
+    b'<section eId="%b"><num>%b</num>%b'
+    b'<content><p>%b</p></content>'
+)
+_SECTION_END = b'</section>'
+_HEADING_TEMPLATE = b'<heading>%b</heading>'
+
+
+def _escape_attr(value: str) -> str:
+    """Escape a value for use inside a double-quoted XML attribute."""
+    return escape(value, _ATTR_ENTITIES)
+
+
+def _escape_text(value: str) -> bytes:
+    """Escape a value as UTF-8 encoded XML character data."""
+    # Most legal text has nothing to escape; a few substring scans are far
+    # cheaper than running every replacement
+    if "&" in value or "<" in value or ">" in value or "\r" in value:
+        return escape(value, _TEXT_ENTITIES).encode("utf-8")
+    return value.encode("utf-8")
+
+
+def _literal(value: str) -> str:
+    """Escape an attribute value so it passes through str.format unchanged."""
+    return _escape_attr(value).replace("{", "{{").replace("}", "}}")
+
+
+@lru_cache(maxsize=128)
+def _meta_template(
+    country: str,
+    document_type: str,
+    language: str,
+    publisher: Optional[str],
+    has_date: bool,
+    pretty_print: bool
+) -> str:
+    """
+    Serialize the metadata block shared by all documents of one shape.
+    
+    The block is built and serialized through lxml once per shape; the
+    per-document values are left as {work_this}, {work_uri}, {work_date}
+    and {manif_date} placeholders for str.format.
+    """
+    work_uri = f"/akn/{country}/{document_type}"
+    expr_uri = f"{work_uri}/{language}@"
+    
+    organization = ""
+    if publisher:
+        organization = _TLC_ORGANIZATION_TEMPLATE.format(
+            publisher=_literal(publisher),
+            country=_literal(country),
+        )
+    
+    fragment = _META_TEMPLATE.format(
+        work_this="{work_this}",
+        work_uri="{work_uri}",
+        work_date='<FRBRdate date="{work_date}"/>' if has_date else "",
+        author=_literal(f"#{publisher or 'author'}"),
+        country=_literal(country),
+        expr_this=_literal(f"{expr_uri}/main"),
+        expr_uri=_literal(expr_uri),
+        language=_literal(language),
+        manif_this=_literal(f"{expr_uri}/main.xml"),
+        manif_uri=_literal(f"{expr_uri}.akn"),
+        manif_date="{manif_date}",
+        organization=organization,
+    )
+    meta = etree.fromstring(fragment)
+    if pretty_print:
+        etree.indent(meta, space="  ", level=1)
+    return etree.tostring(meta, encoding="unicode")
+
+
+def _new_element(parent, tag: str, eid: str) -> etree.Element:
+    """Create an element under parent, or a detached one when parent is None."""
+    if parent is None:
+        return etree.Element(tag, eId=eid)
+    return etree.SubElement(parent, tag, eId=eid)
+
+
 class AkomaNtosoConverter:
-    """Converts legal documents to Akoma Ntoso XML format."""
+    """
+    Converts legal documents to Akoma Ntoso XML format.
+    
+    The converter keeps no per-document state, so a single instance can be
+    reused across calls and shared between threads.
+    """
     
     AKN_NAMESPACE = "http://docs.oasis-open.org/legaldocml/ns/akn/3.0"
     NSMAP = {None: AKN_NAMESPACE}
     
-    def __init__(self):
-        """Initialize the converter."""
-        self.root = None
-        self.meta = None
-        self.body = None
-    
     def convert(self, document: LegalDocument) -> etree.Element:
         """
         Convert a LegalDocument to Akoma Ntoso XML.
@@ -30,97 +163,116 @@ class AkomaNtosoConverter:
         Returns:
             The root XML element
         """
-        # Create root element based on document type
-        doc_type = document.metadata.document_type.lower()
-        self.root = etree.Element(f"{{{self.AKN_NAMESPACE}}}{doc_type}", nsmap=self.NSMAP)
+        root = self._create_root(document)
         
         # Add metadata
-        self._add_metadata(document.metadata)
+        self._add_metadata(document.metadata, root)
         
         # Add main content
-        self._add_body(document)
+        self._add_body(document, root)
         
-        return self.root
+        return root
+    
+    def _create_root(self, document: LegalDocument) -> etree.Element:
+        """Create the root element based on document type."""
+        doc_type = document.metadata.document_type.lower()
+        return etree.Element(f"{{{self.AKN_NAMESPACE}}}{doc_type}", nsmap=self.NSMAP)
     
-    def _add_metadata(self, metadata: DocumentMetadata) -> None:
+    def _add_metadata(self, metadata: DocumentMetadata, root: etree.Element) -> None:
         """Add metadata section to the document."""
-        meta = etree.SubElement(self.root, "meta")
-        
-        # Identification section
-        identification = etree.SubElement(meta, "identification")
-        identification.set("source", "#source")
-        
-        # FRBRWork
-        work = etree.SubElement(identification, "FRBRWork")
-        etree.SubElement(work, "FRBRthis").set("value", metadata.uri or f"/akn/{metadata.country}/{metadata.document_type}/main")
-        etree.SubElement(work, "FRBRuri").set("value", metadata.uri or f"/akn/{metadata.country}/{metadata.document_type}")
-        
-        if metadata.date_enacted:
-            etree.SubElement(work, "FRBRdate").set("date", metadata.date_enacted.isoformat())
-        
-        etree.SubElement(work, "FRBRauthor").set("href", f"#{metadata.publisher or 'author'}")
-        etree.SubElement(work, "FRBRcountry").set("value", metadata.country)
-        
-        # FRBRExpression
-        expr = etree.SubElement(identification, "FRBRExpression")
-        etree.SubElement(expr, "FRBRthis").set("value", f"/akn/{metadata.country}/{metadata.document_type}/{metadata.language}@/main")
-        etree.SubElement(expr, "FRBRuri").set("value", f"/akn/{metadata.country}/{metadata.document_type}/{metadata.language}@")
-        
-        if metadata.date_enacted:
-            etree.SubElement(expr, "FRBRdate").set("date", metadata.date_enacted.isoformat())
-        
-        etree.SubElement(expr, "FRBRauthor").set("href", f"#{metadata.publisher or 'author'}")
-        etree.SubElement(expr, "FRBRlanguage").set("language", metadata.language)
-        
-        # FRBRManifestation
-        manif = etree.SubElement(identification, "FRBRManifestation")
-        etree.SubElement(manif, "FRBRthis").set("value", f"/akn/{metadata.country}/{metadata.document_type}/{metadata.language}@/main.xml")
-        etree.SubElement(manif, "FRBRuri").set("value", f"/akn/{metadata.country}/{metadata.document_type}/{metadata.language}@.akn")
-        etree.SubElement(manif, "FRBRdate").set("date", datetime.now().isoformat())
-        etree.SubElement(manif, "FRBRauthor").set("href", "#legal2akn")
-        
-        # References section
-        references = etree.SubElement(meta, "references")
-        if metadata.publisher:
-            org = etree.SubElement(references, "TLCOrganization")
-            org.set("eId", metadata.publisher)
-            org.set("href", f"/ontology/organization/{metadata.country}/{metadata.publisher}")
-            org.set("showAs", metadata.publisher)
-    
-    def _add_body(self, document: LegalDocument) -> None:
+        root.append(self._build_metadata(metadata))
+    
+    def _build_metadata(self, metadata: DocumentMetadata) -> etree.Element:
+        """Build the detached metadata element."""
+        return etree.fromstring(self._render_metadata(metadata, pretty_print=False))
+    
+    def _render_metadata(self, metadata: DocumentMetadata, pretty_print: bool) -> str:
+        """Render the serialized metadata block from the cached template for its shape."""
+        # Values are written into markup directly rather than set through
+        # lxml, so reject what lxml would before they reach the fragment
+        for value in (metadata.country, metadata.document_type, metadata.language,
+                      metadata.publisher, metadata.uri):
+            if value and _INVALID_XML_CHAR_RE.search(value):
+                raise ValueError(_INVALID_XML_MESSAGE)
+        
+        template = _meta_template(
+            metadata.country,
+            metadata.document_type,
+            metadata.language,
+            metadata.publisher,
+            metadata.date_enacted is not None,
+            pretty_print
+        )
+        work_uri = f"/akn/{metadata.country}/{metadata.document_type}"
+        return template.format(
+            work_this=_escape_attr(metadata.uri or f"{work_uri}/main"),
+            work_uri=_escape_attr(metadata.uri or work_uri),
+            work_date=metadata.date_enacted.isoformat() if metadata.date_enacted else "",
+            manif_date=datetime.now().isoformat(),
+        )
+    
+    def _add_body(self, document: LegalDocument, root: etree.Element) -> None:
         """Add the main body content of the document."""
-        self.body = etree.SubElement(self.root, "body")
-        
+        body = etree.SubElement(root, "body")
+        body.extend([build(item) for build, item in self._body_items(document)])
+    
+    def _body_items(self, document: LegalDocument):
+        """Yield (build method, item) pairs for the body content in document order."""
         # Add preamble if exists
         if document.preamble:
-            preamble = etree.SubElement(self.body, "preamble")
-            p = etree.SubElement(preamble, "p")
-            p.text = document.preamble
+            yield self._build_preamble, document.preamble
         
         # Add hierarchical content
         if document.parts:
             for part in document.parts:
-                self._add_part(part)
+                yield self._build_part, part
         elif document.chapters:
             for chapter in document.chapters:
-                self._add_chapter(chapter)
+                yield self._build_chapter, chapter
         elif document.articles:
             for article in document.articles:
-                self._add_article(article, self.body)
+                yield self._build_article, article
         elif document.sections:
             for section in document.sections:
-                self._add_section(section, self.body)
+                yield self._build_section, section
         
         # Add conclusions if exists
         if document.conclusions:
-            conclusions = etree.SubElement(self.body, "conclusions")
-            p = etree.SubElement(conclusions, "p")
-            p.text = document.conclusions
+            yield self._build_conclusions, document.conclusions
+    
+    def _build_preamble(self, text: str) -> etree.Element:
+        """Build a preamble element."""
+        preamble = etree.Element("preamble")
+        p = etree.SubElement(preamble, "p")
+        p.text = text
+        return preamble
+    
+    def _build_conclusions(self, text: str) -> etree.Element:
+        """Build a conclusions element."""
+        conclusions = etree.Element("conclusions")
+        p = etree.SubElement(conclusions, "p")
+        p.text = text
+        return conclusions
+    
+    def _build_part(self, part: Part) -> etree.Element:
+        """Build a detached part element (for Constitution)."""
+        return self._add_part(part, None)
+    
+    def _build_chapter(self, chapter: Chapter) -> etree.Element:
+        """Build a detached chapter element."""
+        return self._add_chapter_to_parent(chapter, None)
+    
+    def _build_article(self, article: Article) -> etree.Element:
+        """Build a detached article element."""
+        return self._add_article(article, None)
+    
+    def _build_section(self, section: Section) -> etree.Element:
+        """Build a detached section element."""
+        return self._parse_sections([section])[0]
     
-    def _add_part(self, part: Part) -> None:
+    def _add_part(self, part: Part, parent: Optional[etree.Element]) -> etree.Element:
         """Add a part element (for Constitution)."""
-        part_elem = etree.SubElement(self.body, "part")
-        part_elem.set("eId", part.id)
+        part_elem = _new_element(parent, "part", part.id)
         
         num = etree.SubElement(part_elem, "num")
         num.text = f"PART {part.number}"
@@ -136,15 +288,12 @@ class AkomaNtosoConverter:
         # Add chapters if any
         for chapter in part.chapters:
             self._add_chapter_to_parent(chapter, part_elem)
+        
+        return part_elem
     
-    def _add_chapter(self, chapter: Chapter) -> None:
-        """Add a chapter element."""
-        self._add_chapter_to_parent(chapter, self.body)
-    
-    def _add_chapter_to_parent(self, chapter: Chapter, parent: etree.Element) -> None:
+    def _add_chapter_to_parent(self, chapter: Chapter, parent: Optional[etree.Element]) -> etree.Element:
         """Add a chapter element to a parent element."""
-        chapter_elem = etree.SubElement(parent, "chapter")
-        chapter_elem.set("eId", chapter.id)
+        chapter_elem = _new_element(parent, "chapter", chapter.id)
         
         num = etree.SubElement(chapter_elem, "num")
         num.text = chapter.number
@@ -155,11 +304,12 @@ class AkomaNtosoConverter:
         
         for article in chapter.articles:
             self._add_article(article, chapter_elem)
+        
+        return chapter_elem
     
-    def _add_article(self, article: Article, parent: etree.Element) -> None:
+    def _add_article(self, article: Article, parent: Optional[etree.Element]) -> etree.Element:
         """Add an article element."""
-        article_elem = etree.SubElement(parent, "article")
-        article_elem.set("eId", article.id)
+        article_elem = _new_element(parent, "article", article.id)
         
         num = etree.SubElement(article_elem, "num")
         num.text = article.number
@@ -168,34 +318,90 @@ class AkomaNtosoConverter:
             heading = etree.SubElement(article_elem, "heading")
             heading.text = article.heading
         
-        for section in article.sections:
-            self._add_section(section, article_elem)
+        if article.sections:
+            article_elem.extend(self._parse_sections(article.sections))
+        
+        return article_elem
+    
+    def _parse_sections(self, sections: List[Section]) -> List[etree.Element]:
+        """Render sections as one bytes fragment and parse it in a single call."""
+        fragment = b"<sections>" + b"".join(map(self._render_section, sections)) + b"</sections>"
+        try:
+            wrapper = etree.fromstring(fragment)
+        except (etree.XMLSyntaxError, ValueError):
+            # Text lxml will not accept (control characters, oversized nodes):
+            # build through the element API so the usual error is raised
+            return [self._add_section(section, None) for section in sections]
+        
+        if b"<num></num>" in fragment or b"<p></p>" in fragment:
+            # The parser drops empty text, the element API keeps it
+            for elem in wrapper.iter("num", "p"):
+                if elem.text is None:
+                    elem.text = ""
+        
+        return list(wrapper)
     
-    def _add_section(self, section: Section, parent: etree.Element) -> None:
+    def _render_section(self, section: Section) -> bytes:
+        """Render a section and its subsections as an XML fragment."""
+        # Walk the subsections with an explicit stack; closing tags are
+        # pushed below a section's children so they come out after them
+        chunks = []
+        stack = [section]
+        while stack:
+            item = stack.pop()
+            if item is _SECTION_END:
+                chunks.append(item)
+                continue
+            
+            heading = _HEADING_TEMPLATE % _escape_text(item.heading) if item.heading else b""
+            chunks.append(_SECTION_TEMPLATE % (
+                _escape_attr(item.id).encode("utf-8"),
+                _escape_text(item.number),
+                heading,
+                _escape_text(item.content),
+            ))
+            stack.append(_SECTION_END)
+            stack.extend(reversed(item.subsections))
+        
+        return b"".join(chunks)
+    
+    def _add_section(self, section: Section, parent: Optional[etree.Element]) -> etree.Element:
         """Add a section element."""
-        section_elem = etree.SubElement(parent, "section")
-        section_elem.set("eId", section.id)
-        
-        num = etree.SubElement(section_elem, "num")
-        num.text = section.number
-        
-        if section.heading:
-            heading = etree.SubElement(section_elem, "heading")
-            heading.text = section.heading
-        
-        # Add content
-        content = etree.SubElement(section_elem, "content")
-        p = etree.SubElement(content, "p")
-        p.text = section.content
+        # Iterative depth-first walk; children are pushed in reverse so each
+        # parent receives its subsections in document order
+        section_elem = None
+        stack = [(section, parent)]
+        while stack:
+            sec, par = stack.pop()
+            elem = _new_element(par, "section", sec.id)
+            
+            num = etree.SubElement(elem, "num")
+            num.text = sec.number
+            
+            if sec.heading:
+                heading = etree.SubElement(elem, "heading")
+                heading.text = sec.heading
+            
+            # Add content
+            content = etree.SubElement(elem, "content")
+            p = etree.SubElement(content, "p")
+            p.text = sec.content
+            
+            if section_elem is None:
+                section_elem = elem
+            
+            # Add subsections
+            stack.extend((sub, elem) for sub in reversed(sec.subsections))
         
-        # Add subsections
-        for subsection in section.subsections:
-            self._add_section(subsection, section_elem)
+        return section_elem
     
-    def to_string(self, document: LegalDocument, pretty_print: bool = True) -> str:
+    def to_string(self, document: LegalDocument, pretty_print: bool = False) -> str:
         """
         Convert a document to Akoma Ntoso XML string.
         
+        The output is compact by default; use to_pretty_string for an
+        indented version meant for reading.
+        
         Args:
             document: The legal document to convert
             pretty_print: Whether to format the output
@@ -203,15 +409,31 @@ class AkomaNtosoConverter:
         Returns:
             XML string representation
         """
-        root = self.convert(document)
-        return etree.tostring(
-            root,
-            pretty_print=pretty_print,
-            xml_declaration=True,
-            encoding="UTF-8"
-        ).decode("utf-8")
-    
-    def to_file(self, document: LegalDocument, filepath: Union[str, Path], pretty_print: bool = True) -> None:
+        # Serialize the body through lxml and splice in the metadata block,
+        # which comes pre-rendered from the per-shape template cache
+        root = self._create_root(document)
+        self._add_body(document, root)
+        xml = etree.tostring(root, pretty_print=pretty_print, encoding="unicode")
+        
+        meta = self._render_metadata(document.metadata, pretty_print)
+        if pretty_print:
+            meta = "\n  " + meta
+        start_tag_end = xml.index(">") + 1
+        return _XML_DECLARATION + xml[:start_tag_end] + meta + xml[start_tag_end:]
+    
+    def to_pretty_string(self, document: LegalDocument) -> str:
+        """
+        Convert a document to an indented Akoma Ntoso XML string for preview.
+        
+        Args:
+            document: The legal document to convert
+            
+        Returns:
+            Indented XML string representation
+        """
+        return self.to_string(document, pretty_print=True)
+    
+    def to_file(self, document: LegalDocument, filepath: Union[str, Path], pretty_print: bool = False) -> None:
         """
         Convert a document and save to file.
         
@@ -221,4 +443,57 @@ class AkomaNtosoConverter:
             pretty_print: Whether to format the output
         """
         xml_string = self.to_string(document, pretty_print)
-        Path(filepath).write_text(xml_string, encoding="utf-8")
\ No newline at end of file
+        Path(filepath).write_text(xml_string, encoding="utf-8")
+    
+    def to_file_streaming(self, document: LegalDocument, filepath: Union[str, Path], pretty_print: bool = False) -> None:
+        """
+        Convert a document and write it to file incrementally.
+        
+        Each top-level body element is built, written and discarded in turn,
+        so peak memory follows the largest part or chapter rather than the
+        whole document. Use this instead of to_file for large documents.
+        
+        The output is streamed to a temporary file beside filepath and moved
+        into place once complete, so a failure part-way through leaves any
+        existing file untouched.
+        
+        Args:
+            document: The legal document to convert
+            filepath: Path to save the XML file
+            pretty_print: Whether to format the output
+        """
+        doc_type = document.metadata.document_type.lower()
+        newline, indent = ("\n", "  ") if pretty_print else ("", "")
+        
+        filepath = Path(filepath)
+        tmp_file = filepath.with_name(f"{filepath.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp_file, "wb") as output:
+                with etree.xmlfile(output, encoding="UTF-8") as xf:
+                    xf.write_declaration()
+                    with xf.element(f"{{{self.AKN_NAMESPACE}}}{doc_type}", nsmap=self.NSMAP):
+                        meta = self._build_metadata(document.metadata)
+                        self._write_element(xf, meta, 1, pretty_print)
+                        
+                        items = list(self._body_items(document))
+                        if not items:
+                            self._write_element(xf, etree.Element("body"), 1, pretty_print)
+                        else:
+                            xf.write(newline + indent)
+                            with xf.element("body"):
+                                for build, item in items:
+                                    self._write_element(xf, build(item), 2, pretty_print)
+                                xf.write(newline + indent)
+                        xf.write(newline)
+                output.write(newline.encode("utf-8"))
+            os.replace(tmp_file, filepath)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
+    
+    def _write_element(self, xf, elem: etree.Element, level: int, pretty_print: bool) -> None:
+        """Write a complete subtree to an incremental writer at the given depth."""
+        if pretty_print:
+            etree.indent(elem, space="  ", level=level)
+            xf.write("\n" + "  " * level)
+        xf.write(elem)
@@ -1,23 +1,116 @@
 """Parser for extracting structure from plain text legal documents."""
 
+import itertools
 import re
+import sys
+from dataclasses import dataclass, field
 from typing import List, Optional, Tuple
 from .models import LegalDocument, Part, Chapter, Article, Section, DocumentMetadata
 
 
+# Common patterns for legal document structure, without the trailing heading.
+# Parts pattern for Constitution (e.g., PART I, PART XIX-A)
+_LEVEL_PATTERNS = {
+    'part': r'^PART\s+(?P<part_num>[IVXLCDM]+(?:-[A-Z])?)\s*[–—-]?\s*',
+    'chapter': r'^CHAPTER\s+(?P<chapter_num>\d+|[IVXLCDM]+)\.?\s*[-:]?\s*',
+    'article': r'^(?:Article|Art\.?)\s+(?P<article_num>\d+[A-Z]?)\.?\s*[-:]?\s*',
+    'section': r'^(?:Section|Sec\.?|§)\s+(?P<section_num>\d+(?:\.\d+)*)\s*[-:]?\s*',
+}
+
+# Shortest prefix that decides whether a line is a heading of the given level
+_LEVEL_LEADS = {
+    'part': r'PART\s+[IVXLCDM]',
+    'chapter': r'CHAPTER\s+[\dIVXLCDM]',
+    'article': r'(?:Article|Art\.?)\s+\d',
+    'section': r'(?:Section|Sec\.?|§)\s+\d',
+}
+
+# Nesting depth of each level; parts and chapters are never scanned together
+_LEVEL_DEPTH = {'part': 0, 'chapter': 0, 'article': 1, 'section': 2}
+
+
+def _compile_levels(*levels: str, nested: bool = True) -> re.Pattern:
+    """
+    Combine level patterns into one alternation with a named group per level.
+    
+    When nested, a heading that runs onto the next line may not swallow a
+    heading of an enclosing level, matching the boundaries of a scan that
+    slices the text level by level. The heading group excludes trailing
+    whitespace so it never needs stripping.
+    """
+    alternatives = []
+    for depth, level in enumerate(levels):
+        guard = ''
+        if nested and depth:
+            outer = '|'.join(_LEVEL_LEADS[name] for name in levels[:depth])
+            guard = f'(?!^(?:{outer}))'
+        alternatives.append(rf'(?P<{level}>{_LEVEL_PATTERNS[level]}{guard}(?P<{level}_heading>(?:.*\S)?)[^\S\n]*$)')
+    return re.compile('|'.join(alternatives), re.IGNORECASE | re.MULTILINE)
+
+
+CONSTITUTION_RE = _compile_levels('part', 'article', 'section')
+ACT_RE = _compile_levels('chapter', 'article', 'section')
+SUBSECTION_RE = re.compile(r'^\s*\(([a-z]|\d+)\)\s+(.*)$', re.MULTILINE)
+SUBSECTION_MARKER_RE = re.compile(r'^\s*\([a-z]|\d+\)\s*')
+
+# Any top-level structural heading, used to locate the end of the preamble in one pass
+STRUCTURE_RE = _compile_levels('part', 'chapter', 'article', 'section', nested=False)
+
+# Prefixes a heading line can start with; the full pattern only runs where one matches
+_HEADING_START_RE = re.compile(r'(?i:PART|CHAPTER|ART|SEC|§)')
+
+# The same prefixes after a newline. Leading with a literal lets the regex
+# engine jump from newline to newline instead of trying every offset
+_HEADING_LINE_RE = re.compile(r'\n(?=(?i:PART|CHAPTER|ART|SEC|§))')
+
+
+def _iter_headings(text: str, pattern: re.Pattern, pos: int = 0):
+    """
+    Yield heading matches of pattern in text, like pattern.finditer(text, pos).
+    
+    Headings always start a line, so candidate lines are found inside the
+    regex engine and the full pattern only runs on those. Only newline
+    characters end a line, as with "^" in a multiline pattern.
+    """
+    first = [pos] if _HEADING_START_RE.match(text, pos) else []
+    starts = itertools.chain(first, (m.end() for m in _HEADING_LINE_RE.finditer(text, pos)))
+    
+    resume = pos
+    for start in starts:
+        if start < resume:
+            # Line already consumed by a heading that continued onto it
+            continue
+        
+        match = pattern.match(text, start)
+        if match:
+            yield match
+            resume = match.end()
+
+
+def _trim_span(text: str, start: int, end: int) -> Tuple[int, int]:
+    """Narrow text[start:end] to exclude surrounding whitespace, without copying."""
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    return start, end
+
+
+@dataclass
+class _RawNode:
+    """A heading found by the structure scan, with its content kept as offsets into the text."""
+    
+    level: str
+    number: str
+    heading: Optional[str]
+    start: int
+    end: int
+    children: List["_RawNode"] = field(default_factory=list)
+
+
 class DocumentParser:
     """Parse plain text legal documents into structured format."""
     
-    def __init__(self):
-        """Initialize the parser with regex patterns."""
-        # Common patterns for legal document structure
-        # Parts pattern for Constitution (e.g., PART I, PART XIX-A)
-        self.part_pattern = re.compile(r'^PART\s+([IVXLCDM]+(?:-[A-Z])?)\s*[–—-]?\s*(.*)$', re.IGNORECASE | re.MULTILINE)
-        self.chapter_pattern = re.compile(r'^CHAPTER\s+(\d+|[IVXLCDM]+)\.?\s*[-:]?\s*(.*)$', re.IGNORECASE | re.MULTILINE)
-        self.article_pattern = re.compile(r'^(?:Article|Art\.?)\s+(\d+[A-Z]?)\.?\s*[-:]?\s*(.*)$', re.IGNORECASE | re.MULTILINE)
-        self.section_pattern = re.compile(r'^(?:Section|Sec\.?|§)\s+(\d+(?:\.\d+)*)\s*[-:]?\s*(.*)$', re.IGNORECASE | re.MULTILINE)
-        self.subsection_pattern = re.compile(r'^\s*\(([a-z]|\d+)\)\s+(.*)$', re.MULTILINE)
-    
     def parse(self, text: str, metadata: Optional[DocumentMetadata] = None) -> LegalDocument:
         """
         Parse plain text into a structured legal document.
@@ -38,163 +131,125 @@ class DocumentParser:
         preamble_end = self._find_first_structure(text)
         if preamble_end > 0:
             document.preamble = text[:preamble_end].strip()
-            text = text[preamble_end:]
+        body_start = max(preamble_end, 0)
         
         # Check if this is a Constitution document (has Parts)
         if metadata and metadata.document_type.lower() == 'constitution':
-            parts = self._extract_parts(text)
-            if parts:
-                document.parts = parts
+            level, raw_parts = self._parse_structure(text, CONSTITUTION_RE, body_start)
+            if level == 'part':
+                document.parts = [self._build_node(node, text) for node in raw_parts]
                 return document
         
-        # Check for chapters
-        chapters = self._extract_chapters(text)
-        if chapters:
-            document.chapters = chapters
+        # Fall back from chapters to articles to bare sections
+        level, raw_nodes = self._parse_structure(text, ACT_RE, body_start)
+        nodes = [self._build_node(node, text) for node in raw_nodes]
+        if level == 'chapter':
+            document.chapters = nodes
+        elif level == 'article':
+            document.articles = nodes
         else:
-            # Check for articles
-            articles = self._extract_articles(text)
-            if articles:
-                document.articles = articles
-            else:
-                # Extract sections directly
-                document.sections = self._extract_sections(text)
+            document.sections = nodes
         
         return document
     
     def _find_first_structure(self, text: str) -> int:
         """Find the position of the first structural element."""
-        positions = []
-        
-        for pattern in [self.part_pattern, self.chapter_pattern, self.article_pattern, self.section_pattern]:
-            match = pattern.search(text)
-            if match:
-                positions.append(match.start())
-        
-        return min(positions) if positions else -1
+        match = next(_iter_headings(text, STRUCTURE_RE), None)
+        return match.start() if match else -1
     
-    def _extract_parts(self, text: str) -> List[Part]:
-        """Extract parts from Constitution text."""
-        parts = []
-        matches = list(self.part_pattern.finditer(text))
+    def _parse_structure(self, text: str, pattern: re.Pattern, start: int = 0) -> Tuple[Optional[str], List[_RawNode]]:
+        """
+        Build the document hierarchy in a single pass over the text.
         
-        for i, match in enumerate(matches):
-            part_num = match.group(1)
-            part_heading = match.group(2).strip()
-            
-            # Get content until next part or end
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            content = text[start:end]
-            
-            # Extract articles within this part
-            articles = self._extract_articles(content)
+        Headings are visited in document order and attached to the nearest
+        open parent one level up; headings with no such parent (e.g. a section
+        before the first article) are dropped.
+        
+        Args:
+            text: The full document text
+            pattern: Combined heading pattern for the levels to extract
+            start: Offset where the body begins (after the preamble)
             
-            part = Part(
-                id=f"part_{part_num.replace('-', '_')}",
-                number=part_num,
-                heading=part_heading if part_heading else None,
-                articles=articles
-            )
-            parts.append(part)
+        Returns:
+            Tuple of (outermost level found, list of top-level raw nodes)
+        """
+        matches = list(_iter_headings(text, pattern, start))
+        if not matches:
+            return None, []
         
-        return parts
-    
-    def _extract_chapters(self, text: str) -> List[Chapter]:
-        """Extract chapters from text."""
-        chapters = []
-        matches = list(self.chapter_pattern.finditer(text))
+        top_level = min((match.lastgroup for match in matches), key=_LEVEL_DEPTH.get)
+        top_depth = _LEVEL_DEPTH[top_level]
         
+        nodes = []
+        stack = []  # (depth, node) for the currently open elements
         for i, match in enumerate(matches):
-            chapter_num = match.group(1)
-            chapter_heading = match.group(2).strip()
+            level = match.lastgroup
+            depth = _LEVEL_DEPTH[level]
+            while stack and stack[-1][0] >= depth:
+                stack.pop()
             
-            # Get content until next chapter or end
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            content = text[start:end]
+            if depth != top_depth and not (stack and stack[-1][0] == depth - 1):
+                continue
             
-            # Extract articles within this chapter
-            articles = self._extract_articles(content)
-            
-            chapter = Chapter(
-                id=f"chp_{chapter_num}",
-                number=chapter_num,
-                heading=chapter_heading if chapter_heading else None,
-                articles=articles
+            # Content runs until the next heading of any level or end
+            node = _RawNode(
+                level=level,
+                number=match.group(f'{level}_num'),
+                heading=match.group(f'{level}_heading') or None,
+                start=match.end(),
+                end=matches[i + 1].start() if i + 1 < len(matches) else len(text)
             )
-            chapters.append(chapter)
+            
+            if stack:
+                stack[-1][1].children.append(node)
+            else:
+                nodes.append(node)
+            stack.append((depth, node))
         
-        return chapters
+        return top_level, nodes
     
-    def _extract_articles(self, text: str) -> List[Article]:
-        """Extract articles from text."""
-        articles = []
-        matches = list(self.article_pattern.finditer(text))
+    def _build_node(self, node: _RawNode, text: str):
+        """Convert a raw node and its children into document models."""
+        number, heading = node.number, node.heading
+        children = [self._build_node(child, text) for child in node.children]
         
-        for i, match in enumerate(matches):
-            article_num = match.group(1)
-            article_heading = match.group(2).strip()
-            
-            # Get content until next article or end
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            content = text[start:end]
-            
-            # Extract sections within this article
-            sections = self._extract_sections(content)
-            
-            article = Article(
-                id=f"art_{article_num}",
-                number=article_num,
-                heading=article_heading if article_heading else None,
-                sections=sections
-            )
-            articles.append(article)
+        if node.level == 'part':
+            return Part(id=f"part_{number.replace('-', '_')}", number=number, heading=heading, articles=children)
+        if node.level == 'chapter':
+            return Chapter(id=f"chp_{number}", number=number, heading=heading, articles=children)
+        if node.level == 'article':
+            return Article(id=f"art_{number}", number=number, heading=heading, sections=children)
         
-        return articles
-    
-    def _extract_sections(self, text: str) -> List[Section]:
-        """Extract sections from text."""
-        sections = []
-        matches = list(self.section_pattern.finditer(text))
+        # Sections are leaves; their content is sliced out only here
+        start, end = _trim_span(text, node.start, node.end)
+        content = text[start:end]
         
-        for i, match in enumerate(matches):
-            section_num = match.group(1)
-            section_heading = match.group(2).strip()
-            
-            # Get content until next section or end
-            start = match.end()
-            end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
-            content = text[start:end].strip()
-            
-            # Extract subsections if any
-            subsections = self._extract_subsections(content)
-            
-            # If subsections found, remove them from main content
-            if subsections:
-                first_subsection = self.subsection_pattern.search(content)
-                if first_subsection:
-                    content = content[:first_subsection.start()].strip()
-            
-            section = Section(
-                id=f"sec_{section_num.replace('.', '_')}",
-                number=section_num,
-                heading=section_heading if section_heading else None,
-                content=content,
-                subsections=subsections
-            )
-            sections.append(section)
+        # Extract subsections if any
+        subsections = self._extract_subsections(content)
+        
+        # If subsections found, remove them from main content
+        if subsections:
+            first_subsection = SUBSECTION_RE.search(content)
+            if first_subsection:
+                content = content[:first_subsection.start()].rstrip()
         
-        return sections
+        return Section(
+            id=f"sec_{number.replace('.', '_')}",
+            number=number,
+            heading=heading,
+            content=content,
+            subsections=subsections
+        )
     
     def _extract_subsections(self, text: str) -> List[Section]:
         """Extract subsections from text."""
         subsections = []
-        matches = list(self.subsection_pattern.finditer(text))
+        matches = list(SUBSECTION_RE.finditer(text))
         
         for i, match in enumerate(matches):
-            subsection_num = match.group(1)
+            # Subsection numbers like 1, 2, a, b repeat in every section;
+            # interning shares one string object per distinct value
+            subsection_num = sys.intern(match.group(1))
             
             # Get content until next subsection or end
             start = match.start()
@@ -202,10 +257,10 @@ class DocumentParser:
             content = text[start:end]
             
             # Clean up the content
-            content = re.sub(r'^\s*\([a-z]|\d+\)\s*', '', content).strip()
+            content = SUBSECTION_MARKER_RE.sub('', content).strip()
             
             subsection = Section(
-                id=f"subsec_{subsection_num}",
+                id=sys.intern(f"subsec_{subsection_num}"),
                 number=subsection_num,
                 heading=None,
                 content=content
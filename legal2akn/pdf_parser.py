@@ -1,32 +1,326 @@
 """PDF parser using pymupdf4llm for better structure extraction."""
 
+import functools
+import hashlib
+import os
 import re
+import statistics
+from importlib.metadata import version
 from pathlib import Path
-from typing import Optional, List, Tuple, Dict
-import pymupdf4llm
+from typing import Optional, List, Tuple, Dict, Union
+import pymupdf
+
+from .parser import _trim_span
+from .pool import run_in_processes
+
+
+# pymupdf4llm output is cached here, keyed by a hash of the PDF contents
+_CACHE_DIR = Path(os.environ.get('XDG_CACHE_HOME') or Path.home() / '.cache') / 'legal2akn'
+
+# Page count below which extract_text_from_pdf skips pymupdf4llm
+SMALL_PDF_PAGES = 2
+
+
+# Parts of the 1950 Constitution, in order
+_EXPECTED_PARTS = ('I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
+                   'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII',
+                   'XIX', 'XX', 'XXI', 'XXII')
+_ROMAN_INDEX = {part: i for i, part in enumerate(_EXPECTED_PARTS)}
+
+# Numerals accepted as part numbers. The part patterns capture any run of
+# Roman numeral letters, which also catches words such as VIVID
+_VALID_ROMANS = frozenset(_EXPECTED_PARTS)
+
+# Parts are usually major headings (# or ##), with a plain-text form for
+# when headers aren't properly detected. Matched line by line across the
+# whole text; [^\S\n] keeps whitespace within a line, like str.strip()
+_PART_RE = re.compile(
+    r'^[^\S\n]*(?:(?i:#{1,2}[^\S\n]*PART[^\S\n]+([IVXLCDM]+))|PART[^\S\n]+([IVXLCDM]+))'
+    r'[^\S\n]*[–—\-\.]?[^\S\n]*(.*)$',
+    re.MULTILINE
+)
+
+# Articles might be subheadings (### or ####), or plain text
+_ARTICLE_RE = re.compile(
+    r'^[^\S\n]*(?:(?i:#{2,4}[^\S\n]*Article[^\S\n]+(\d+[A-Z]?))|Article[^\S\n]+(\d+[A-Z]?))'
+    r'[^\S\n]*[.–—\-]?[^\S\n]*(.*)$',
+    re.MULTILINE
+)
+
+# Schedules are named by an ordinal, e.g. "FIRST SCHEDULE"
+_SCHEDULE_ORDINALS = ('first', 'second', 'third', 'fourth', 'fifth', 'sixth', 'seventh',
+                      'eighth', 'ninth', 'tenth', 'eleventh', 'twelfth')
+
+# Markdown formatting stripped from part and article titles
+_MD_TOKEN_RE = re.compile(r'[#*_]')
+
+# Any expected part mentioned anywhere in the text. Start-of-line, header
+# and bold variants are all matched by this one, so a single scan finds
+# the earliest mention of every part. Each numeral has its own group, as
+# case-insensitive matches (e.g. a dotted capital I) do not upper() back
+_PART_MENTION_RE = re.compile(
+    r'\bPART\s+(?:' + '|'.join(f'(?P<{part}>{part})' for part in _EXPECTED_PARTS) + r')\b',
+    re.IGNORECASE
+)
+
+# Multiple patterns to catch Part VII in various formats, tried in order.
+# Each is a list of alternatives, and each alternative a list of pieces
+# the original pattern joined with a lazy .*? (DOTALL), so that they can
+# be searched one after another instead of backtracking over the text
+_PART_VII_PATTERNS = (
+    # Standard patterns
+    [[r'PART\s+VII\b', r'(?:STATES|STATE)']],
+    [[r'Part\s+VII\b', r'(?:STATES|STATE)']],
+    
+    # With various separators and formatting
+    [[r'PART\s*[-–—\.]*\s*VII\b', r'(?:STATES|STATE)']],
+    [[r'#{1,4}\s*PART\s+VII\b']],
+    [[r'\*\*PART\s+VII\*\*']],
+    
+    # Specific to 1950 Constitution context
+    [[r'VII\b', r'STATES', r'PART\s+B']],
+    [[r'Part\s+B', r'STATES', r'VII']],
+    
+    # Look for "VII" near "Part B" mentions
+    [[r'(?:PART\s+B|Part\s+B)', r'VII'], [r'VII', r'(?:PART\s+B|Part\s+B)']],
+    
+    # Roman numeral patterns with context
+    [[r'(?:^|\n)\s*VII[.\s\-–—]+', r'(?:STATES|First\s+Schedule)']],
+)
+_PART_VII_RES = tuple(
+    (
+        '|'.join('.*?'.join(pieces) for pieces in alternatives),
+        tuple(
+            tuple(re.compile(piece, re.MULTILINE | re.IGNORECASE | re.DOTALL) for piece in pieces)
+            for pieces in alternatives
+        )
+    )
+    for alternatives in _PART_VII_PATTERNS
+)
+
+# Every variant above contains the numeral itself, so one search for it
+# rules out all of them on texts that never mention VII
+_VII_RE = re.compile(r'VII', re.IGNORECASE)
+
+_PART_VII_TITLE_RE = re.compile(
+    r'PART\s+VII\s*[–—\-\.]*\s*(.{0,100}?)(?:\n|PART\s+VIII)',
+    re.IGNORECASE | re.DOTALL
+)
+_TITLE_JUNK_RE = re.compile(r'[#*_\[\](){}]')
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Markdown cleanup for plain text output, applied in this order
+_MD_HEADER_RE = re.compile(r'^#{1,6}\s*', re.MULTILINE)
+_EMPHASIS_RE = re.compile(r'[*_]{1,2}([^*_]+)[*_]{1,2}')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\([^\)]+\)')
+_BLANK_RUN_RE = re.compile(r'\n{3,}')
+_SPACE_RUN_RE = re.compile(r' {2,}')
+
+
+# Characters re.IGNORECASE matches to letters of the landmark words that
+# str.lower() leaves alone (or, for the dotted capital I, lengthens)
+_ODD_CASE_CHARS = (('\u0130', 'i'), ('\u0131', 'i'), ('\u017f', 's'))
+
+
+def _fold_case(text: str) -> str:
+    """
+    Lower-case text without changing its length.
+    
+    Every case-insensitive match of 'part', 'article' or 'schedule' in
+    text appears as that exact lower-case word at the same offset.
+    """
+    for char, plain in _ODD_CASE_CHARS:
+        if char in text:
+            text = text.replace(char, plain)
+    return text.lower()
+
+
+def _find_all(folded: str, word: str):
+    """Yield the offset of every occurrence of word in folded."""
+    pos = folded.find(word)
+    while pos != -1:
+        yield pos
+        pos = folded.find(word, pos + len(word))
+
+
+def _landmark_lines(text: str, folded: str, word: str):
+    """
+    Find the lines containing a landmark word with plain substring search.
+    
+    Line numbers are counted forward from the previous hit, so the work
+    is proportional to the number of hits rather than the number of lines.
+    
+    Args:
+        text: Text to search
+        folded: text after _fold_case
+        word: Lower-case landmark word
+        
+    Yields:
+        (index, start, end) of each line containing word, where start and
+        end are the line's offsets excluding its newline
+    """
+    index = 0
+    counted = 0
+    end = -1
+    for pos in _find_all(folded, word):
+        if pos <= end:
+            continue
+        index += text.count('\n', counted, pos)
+        counted = pos
+        start = text.rfind('\n', 0, pos) + 1
+        end = text.find('\n', pos)
+        if end == -1:
+            end = len(text)
+        yield index, start, end
+
+
+def _has_schedule_heading(text: str, folded: str, start: int, end: int) -> bool:
+    """
+    Check whether text[start:end] names a schedule, such as "First Schedule".
+    
+    Each occurrence of 'schedule', in any case, is checked for in-line
+    whitespace and one of the ordinals just before it, using str.endswith
+    on the folded text.
+    
+    Args:
+        text: Text to search
+        folded: text after _fold_case
+        start: Start offset of the line
+        end: End offset of the line
+        
+    Returns:
+        True if the line names a schedule
+    """
+    pos = folded.find('schedule', start, end)
+    while pos != -1:
+        stop = pos
+        while stop > start and text[stop - 1] != '\n' and text[stop - 1].isspace():
+            stop -= 1
+        if stop < pos and folded.endswith(_SCHEDULE_ORDINALS, start, stop):
+            return True
+        pos = folded.find('schedule', pos + 1, end)
+    return False
+
+
+def _search_lazy_chain(text: str, alternatives) -> Optional[Tuple[int, int]]:
+    """
+    Search text like the regex joining each alternative's pieces with .*?
+    
+    Each piece is searched from where the previous one ended, which finds
+    the same leftmost, shortest match. A piece that is not found after the
+    first occurrence of the one before is not found after any later one,
+    so the search gives up instead of retrying from every later start.
+    
+    Args:
+        text: Text to search
+        alternatives: Tuples of compiled pieces, in order of preference
+        
+    Returns:
+        (start, end) of the match, or None if there is none
+    """
+    best = None
+    for pieces in alternatives:
+        first = pieces[0].search(text)
+        if not first:
+            continue
+        end = first.end()
+        for piece in pieces[1:]:
+            match = piece.search(text, end)
+            if not match:
+                break
+            end = match.end()
+        else:
+            if best is None or first.start() < best[0]:
+                best = (first.start(), end)
+    return best
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_pdf_cached(parser: 'PDFParser', pdf_path: str, mtime_ns: int, size: int) -> Tuple[str, dict]:
+    """
+    Parse a PDF once per parser, path, modification time and size.
+    
+    The modification time and size are not used here; they are part of
+    the key so that a PDF changed on disk is parsed again. Results hold the
+    whole markdown text, hence the small cache size.
+    """
+    md_text = parser.extract_text_from_pdf(Path(pdf_path))
+    return md_text, parser.extract_constitution_structure(md_text)
 
 
 class PDFParser:
     """Extract structured text from PDF legal documents using markdown conversion."""
     
-    def extract_text_from_pdf(self, pdf_path: Path) -> str:
+    def extract_text_from_pdf(self, pdf_path: Path, use_cache: bool = True) -> str:
         """
         Extract text from PDF file using pymupdf4llm for better structure preservation.
         
+        The markdown is cached on disk by the SHA-256 of the PDF contents and
+        the pymupdf4llm and pymupdf versions, so converting the same file
+        again is a read. Entries are never evicted: the cache directory grows
+        with every distinct PDF and library upgrade until it is cleared by
+        hand.
+        PDFs with fewer than SMALL_PDF_PAGES pages skip pymupdf4llm and return
+        the plain text of their pages, as its layout analysis costs more than
+        it recovers on them.
+        
         Args:
             pdf_path: Path to the PDF file
+            use_cache: Whether to read and update the markdown cache
             
         Returns:
             Extracted text in markdown format
         """
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            if doc.page_count < SMALL_PDF_PAGES:
+                return "\n\n".join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
+        
+        cache_file = None
+        if use_cache:
+            cache_file = self._markdown_cache_file(pdf_path)
+            try:
+                return cache_file.read_text(encoding='utf-8')
+            except OSError:
+                pass
+        
+        # Imported here as pymupdf4llm is slow to import and only used with --markdown
+        import pymupdf4llm
+        
         # Convert PDF to markdown
         md_text = pymupdf4llm.to_markdown(str(pdf_path))
+        
+        if cache_file is not None:
+            self._write_markdown_cache(cache_file, md_text)
         return md_text
     
+    def _markdown_cache_file(self, pdf_path: Path) -> Path:
+        """Return the cache file for a PDF's markdown."""
+        with open(pdf_path, 'rb') as f:
+            digest = hashlib.file_digest(f, 'sha256')
+        digest.update(version('pymupdf4llm').encode())
+        digest.update(version('pymupdf').encode())
+        return _CACHE_DIR / f"{digest.hexdigest()}.md"
+    
+    def _write_markdown_cache(self, cache_file: Path, md_text: str) -> None:
+        """Store markdown in the cache; failures only cost a future cache miss."""
+        tmp_file = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file.write_text(md_text, encoding='utf-8')
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            tmp_file.unlink(missing_ok=True)
+    
     def extract_constitution_structure(self, md_text: str) -> dict:
         """
         Extract structure from markdown text for Indian Constitution.
         
+        Parts and articles locate their source line with 'line_range' offsets
+        into md_text; see line_for.
+        
         Args:
             md_text: Markdown formatted text from PDF
             
@@ -39,84 +333,64 @@ class PDFParser:
             'schedules': []
         }
         
-        # Split into lines for processing
-        lines = md_text.split('\n')
-        
-        # Patterns for different elements in markdown
-        # Parts are usually major headings (# or ##)
-        part_pattern = re.compile(r'^#{1,2}\s*PART\s+([IVXLCDM]+)\s*[–—\-\.]?\s*(.*)$', re.IGNORECASE)
-        
-        # Articles might be subheadings (### or ####)
-        article_pattern = re.compile(r'^#{2,4}\s*Article\s+(\d+[A-Z]?)\s*[.–—\-]?\s*(.*)$', re.IGNORECASE)
-        
-        # Alternative patterns for when headers aren't properly detected
-        part_text_pattern = re.compile(r'^\s*PART\s+([IVXLCDM]+)\s*[–—\-\.]?\s*(.*)$')
-        article_text_pattern = re.compile(r'^\s*Article\s+(\d+[A-Z]?)\s*[.–—\-]?\s*(.*)$')
+        # Structure lines all contain a landmark word; find those lines with
+        # substring search and only run the full patterns on them
+        folded = _fold_case(md_text)
         
-        # Schedule pattern
-        schedule_pattern = re.compile(
-            r'(FIRST|SECOND|THIRD|FOURTH|FIFTH|SIXTH|SEVENTH|EIGHTH|NINTH|TENTH|ELEVENTH|TWELFTH)\s+SCHEDULE',
-            re.IGNORECASE
-        )
-        
-        # Process lines
-        seen_parts = set()
-        for i, line in enumerate(lines):
-            line = line.strip()
-            if not line:
+        # Check for Parts (in markdown headers or plain text); the first
+        # occurrence of each number is kept, in document order
+        parts_by_number = {}
+        for i, start, end in _landmark_lines(md_text, folded, 'part'):
+            match = _PART_RE.match(md_text, start, end)
+            if not match:
                 continue
             
-            # Check for Parts (in markdown headers or plain text)
-            match = part_pattern.match(line)
-            if not match:
-                match = part_text_pattern.match(line)
+            part_num = (match.group(1) or match.group(2)).upper()
+            if part_num not in _VALID_ROMANS or part_num in parts_by_number:
+                continue
+            part_title = match.group(3).strip()
             
-            if match:
-                part_num = match.group(1).upper()
-                part_title = match.group(2).strip()
-                
-                # Clean up markdown formatting from title
-                part_title = re.sub(r'[#*_]', '', part_title).strip()
-                
-                # Skip duplicates
-                if part_num not in seen_parts:
-                    seen_parts.add(part_num)
-                    structure['parts'].append({
-                        'number': part_num,
-                        'title': part_title,
-                        'position': i,
-                        'line': line
-                    })
+            # Clean up markdown formatting from title
+            part_title = _MD_TOKEN_RE.sub('', part_title).strip()
             
-            # Check for Articles
-            match = article_pattern.match(line)
+            parts_by_number[part_num] = {
+                'number': part_num,
+                'title': part_title,
+                'position': i,
+                'line_range': _trim_span(md_text, start, end)
+            }
+        structure['parts'] = list(parts_by_number.values())
+        
+        # Check for Articles
+        for i, start, end in _landmark_lines(md_text, folded, 'article'):
+            match = _ARTICLE_RE.match(md_text, start, end)
             if not match:
-                match = article_text_pattern.match(line)
+                continue
             
-            if match:
-                article_num = match.group(1)
-                article_title = match.group(2).strip()
-                
-                # Clean up markdown formatting
-                article_title = re.sub(r'[#*_]', '', article_title).strip()
-                
-                structure['articles'].append({
-                    'number': article_num,
-                    'title': article_title,
-                    'position': i,
-                    'line': line
-                })
+            article_num = match.group(1) or match.group(2)
+            article_title = match.group(3).strip()
             
-            # Check for Schedules
-            if schedule_pattern.search(line):
+            # Clean up markdown formatting
+            article_title = _MD_TOKEN_RE.sub('', article_title).strip()
+            
+            structure['articles'].append({
+                'number': article_num,
+                'title': article_title,
+                'position': i,
+                'line_range': _trim_span(md_text, start, end)
+            })
+        
+        # Check for Schedules
+        for i, start, end in _landmark_lines(md_text, folded, 'schedule'):
+            if _has_schedule_heading(md_text, folded, start, end):
                 structure['schedules'].append({
-                    'name': line,
+                    'name': md_text[start:end].strip(),
                     'position': i
                 })
         
         # Ensure we have all 22 parts for 1950 Constitution
-        if len(structure['parts']) < 22:
-            structure['parts'] = self._fix_missing_parts(md_text, structure['parts'])
+        if len(parts_by_number) < 22:
+            structure['parts'] = self._fix_missing_parts(md_text, structure['parts'], folded)
         
         # Special handling for Part VII which is commonly missed
         part_numbers = {part['number'] for part in structure['parts']}
@@ -125,67 +399,82 @@ class PDFParser:
         
         return structure
     
-    def _fix_missing_parts(self, text: str, found_parts: List[Dict]) -> List[Dict]:
+    def line_for(self, md_text: str, entry: dict) -> Optional[str]:
+        """
+        Get the text a part or article entry was found in.
+        
+        The two structure methods record it differently. Entries from
+        extract_constitution_structure hold 'line_range', the (start, end)
+        offsets of the line in the markdown, or None for a Part VII added
+        without a match. Entries from extract_structure_from_pdf have no
+        markdown to point into, so they hold the heading text as 'line'.
+        
+        Args:
+            md_text: Markdown text the structure was extracted from (unused
+                for entries that hold 'line')
+            entry: Part or article from either structure method
+            
+        Returns:
+            The matched line, or None for a part added without one
+        """
+        if 'line' in entry:
+            return entry['line']
+        line_range = entry['line_range']
+        if line_range is None:
+            return None
+        start, end = line_range
+        return md_text[start:end]
+    
+    def _fix_missing_parts(self, text: str, found_parts: List[Dict], folded: Optional[str] = None) -> List[Dict]:
         """
         Try to find missing parts using various patterns.
         
         Args:
             text: Full markdown text
             found_parts: List of already found parts
+            folded: text after _fold_case, if already computed
             
         Returns:
             Updated list of parts
         """
-        # Expected parts for 1950 Constitution
-        expected_parts = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
-                         'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII',
-                         'XIX', 'XX', 'XXI', 'XXII']
-        
         found_numbers = {part['number'] for part in found_parts}
         
-        # Try different patterns for missing parts
-        patterns = [
-            r'\bPART\s+{part}\b',  # Basic pattern
-            r'^\s*PART\s+{part}\s',  # Start of line
-            r'#{{1,4}}\s*PART\s+{part}\b',  # With markdown headers
-            r'\*\*PART\s+{part}\*\*',  # Bold markdown
-        ]
+        # Earliest mention of each missing part, from one pass over the text
+        # that stops as soon as all of them have been seen
+        missing = {part for part in _EXPECTED_PARTS if part not in found_numbers}
+        first_mentions = {}
+        if missing:
+            if folded is None:
+                folded = _fold_case(text)
+            matches = (_PART_MENTION_RE.match(text, pos) for pos in _find_all(folded, 'part'))
+            for match in filter(None, matches):
+                if match.lastgroup in missing:
+                    first_mentions.setdefault(match.lastgroup, match)
+                    if len(first_mentions) == len(missing):
+                        break
         
-        for expected in expected_parts:
+        for expected in _EXPECTED_PARTS:
             if expected not in found_numbers:
-                for pattern_template in patterns:
-                    pattern = re.compile(pattern_template.format(part=re.escape(expected)), re.MULTILINE | re.IGNORECASE)
-                    match = pattern.search(text)
-                    if match:
-                        # Extract context for title
-                        start = match.end()
-                        end = text.find('\n', start)
-                        if end == -1:
-                            end = start + 100
-                        title = text[start:end].strip(' -–—.*#\n')
-                        
-                        # Find insertion position
-                        insert_pos = 0
-                        for i, part in enumerate(found_parts):
-                            try:
-                                if expected_parts.index(expected) < expected_parts.index(part['number']):
-                                    insert_pos = i
-                                    break
-                            except ValueError:
-                                continue
-                        else:
-                            insert_pos = len(found_parts)
-                        
-                        found_parts.insert(insert_pos, {
-                            'number': expected,
-                            'title': title if title else f"Part {expected}",
-                            'position': match.start(),
-                            'line': match.group(0)
-                        })
-                        found_numbers.add(expected)
-                        break
+                match = first_mentions.get(expected)
+                if match:
+                    # Extract context for title; find stops at the next
+                    # newline, so this only scans the rest of one line
+                    start = match.end()
+                    end = text.find('\n', start)
+                    if end == -1:
+                        end = start + 100
+                    title = text[start:end].strip(' -–—.*#\n')
+                    
+                    # Appended here and put in order by the final sort
+                    found_parts.append({
+                        'number': expected,
+                        'title': title if title else f"Part {expected}",
+                        'position': match.start(),
+                        'line_range': match.span()
+                    })
+                    found_numbers.add(expected)
         
-        return sorted(found_parts, key=lambda x: expected_parts.index(x['number']) if x['number'] in expected_parts else 999)
+        return sorted(found_parts, key=lambda x: _ROMAN_INDEX.get(x['number'], 999))
     
     def _find_part_vii_specifically(self, text: str, found_parts: List[Dict]) -> List[Dict]:
         """
@@ -198,106 +487,197 @@ class PDFParser:
         Returns:
             Updated list of parts with Part VII if found
         """
-        # Multiple patterns to catch Part VII in various formats
-        part_vii_patterns = [
-            # Standard patterns
-            r'PART\s+VII\b.*?(?:STATES|STATE)',
-            r'Part\s+VII\b.*?(?:STATES|STATE)',
-            
-            # With various separators and formatting
-            r'PART\s*[-–—\.]*\s*VII\b.*?(?:STATES|STATE)',
-            r'#{1,4}\s*PART\s+VII\b',
-            r'\*\*PART\s+VII\*\*',
-            
-            # Specific to 1950 Constitution context
-            r'VII\b.*?STATES.*?PART\s+B',
-            r'Part\s+B.*?STATES.*?VII',
+        # Patterns are tried in order of preference, as the first one to match
+        # anywhere decides the position; skip them all if VII never appears
+        patterns = _PART_VII_RES if _VII_RE.search(text) else ()
+        for pattern, alternatives in patterns:
+            span = _search_lazy_chain(text, alternatives)
             
-            # Look for "VII" near "Part B" mentions
-            r'(?:PART\s+B|Part\s+B).*?VII|VII.*?(?:PART\s+B|Part\s+B)',
-            
-            # Roman numeral patterns with context
-            r'(?:^|\n)\s*VII[.\s\-–—]+.*?(?:STATES|First\s+Schedule)',
-        ]
-        
-        for pattern_str in part_vii_patterns:
-            pattern = re.compile(pattern_str, re.MULTILINE | re.IGNORECASE | re.DOTALL)
-            match = pattern.search(text)
-            
-            if match:
+            if span:
                 # Extract title - look for content after "PART VII" or around the match
                 title = "THE STATES IN PART B OF THE FIRST SCHEDULE"
                 
                 # Try to extract actual title from text
-                vii_context_pattern = re.compile(
-                    r'PART\s+VII\s*[–—\-\.]*\s*(.{0,100}?)(?:\n|PART\s+VIII)',
-                    re.IGNORECASE | re.DOTALL
-                )
-                context_match = vii_context_pattern.search(text)
+                context_match = _PART_VII_TITLE_RE.search(text)
                 if context_match:
                     extracted_title = context_match.group(1).strip()
                     # Clean up the extracted title
-                    extracted_title = re.sub(r'[#*_\[\](){}]', '', extracted_title)
-                    extracted_title = re.sub(r'\s+', ' ', extracted_title).strip()
+                    extracted_title = _TITLE_JUNK_RE.sub('', extracted_title)
+                    extracted_title = _WHITESPACE_RE.sub(' ', extracted_title).strip()
                     if len(extracted_title) > 5 and len(extracted_title) < 100:
                         title = extracted_title
                 
-                # Find correct position to insert Part VII (between VI and VIII)
-                insert_pos = len(found_parts)
-                for i, part in enumerate(found_parts):
-                    if part['number'] in ['VIII', 'IX', 'X']:  # Insert before Part VIII or later
-                        insert_pos = i
-                        break
-                
-                found_parts.insert(insert_pos, {
+                # The final sort puts Part VII between VI and VIII
+                found_parts.append({
                     'number': 'VII',
                     'title': title,
-                    'position': match.start(),
-                    'line': match.group(0)[:100]  # First 100 chars of match
+                    'position': span[0],
+                    'line_range': (span[0], min(span[1], span[0] + 100))  # First 100 chars of match
                 })
                 
-                print(f"Found Part VII using pattern: {pattern_str}")
+                print(f"Found Part VII using pattern: {pattern}")
                 break
         else:
             # If no pattern matches, create Part VII with default title
             print("Part VII not found in text, adding with default title")
-            insert_pos = len(found_parts)
-            for i, part in enumerate(found_parts):
-                if part['number'] in ['VIII', 'IX', 'X']:
-                    insert_pos = i
-                    break
-            
-            found_parts.insert(insert_pos, {
+            found_parts.append({
                 'number': 'VII',
                 'title': 'THE STATES IN PART B OF THE FIRST SCHEDULE',
                 'position': -1,  # Indicate this was manually added
-                'line': 'PART VII (manually added)'
+                'line_range': None
             })
         
         # Sort to maintain proper order
-        expected_parts = ['I', 'II', 'III', 'IV', 'V', 'VI', 'VII', 'VIII', 'IX', 'X',
-                         'XI', 'XII', 'XIII', 'XIV', 'XV', 'XVI', 'XVII', 'XVIII',
-                         'XIX', 'XX', 'XXI', 'XXII']
-        
-        return sorted(found_parts, key=lambda x: expected_parts.index(x['number']) if x['number'] in expected_parts else 999)
+        return sorted(found_parts, key=lambda x: _ROMAN_INDEX.get(x['number'], 999))
     
     def parse_pdf_to_text(self, pdf_path: Path) -> Tuple[str, dict]:
         """
         Parse PDF and extract both markdown text and structure.
         
+        Results are cached in memory until the file changes or invalidate()
+        is called. Each call gets its own copy of the structure, so callers
+        may modify it freely.
+        
         Args:
             pdf_path: Path to PDF file
             
         Returns:
             Tuple of (markdown_text, structure_dict)
         """
-        # Extract markdown text
-        md_text = self.extract_text_from_pdf(pdf_path)
+        stat = os.stat(pdf_path)
+        md_text, structure = _parse_pdf_cached(self, str(pdf_path), stat.st_mtime_ns, stat.st_size)
+        
+        # Entries only hold strings, numbers and tuples, so copying the lists
+        # and entry dicts keeps the cached structure intact
+        return md_text, {key: [dict(entry) for entry in entries] for key, entries in structure.items()}
+    
+    def invalidate(self) -> None:
+        """Drop all results cached in memory by parse_pdf_to_text."""
+        _parse_pdf_cached.cache_clear()
+    
+    def extract_structure_from_pdf(self, pdf_path: Path) -> dict:
+        """
+        Extract part, article and schedule headings straight from the PDF.
+        
+        Pages are streamed through PyMuPDF and only lines set larger than the
+        page's median font size are checked, so no markdown is built. Unlike
+        extract_constitution_structure, positions are page numbers, parts and
+        articles keep their heading text as 'line' (see line_for), and the
+        text-wide fallbacks for missing parts are not applied.
+        
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Dictionary with parts, articles, and other structure
+        """
+        structure = {
+            'parts': [],
+            'articles': [],
+            'schedules': []
+        }
+        
+        parts_by_number = {}
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            for page_number, page in enumerate(doc):
+                headings = self._heading_lines(page)
+                for i, line in enumerate(headings):
+                    # As in extract_constitution_structure, a line is only
+                    # checked for the landmark words it contains
+                    folded = _fold_case(line)
+                    
+                    # Check for Parts
+                    match = _PART_RE.match(line) if 'part' in folded else None
+                    if match:
+                        part_num = (match.group(1) or match.group(2)).upper()
+                        part_title = _MD_TOKEN_RE.sub('', match.group(3)).strip()
+                        
+                        # Part titles are usually set on the heading line below
+                        if not part_title and i + 1 < len(headings):
+                            part_title = headings[i + 1]
+                        
+                        if part_num in _VALID_ROMANS and part_num not in parts_by_number:
+                            parts_by_number[part_num] = {
+                                'number': part_num,
+                                'title': part_title,
+                                'position': page_number,
+                                'line': line
+                            }
+                    
+                    # Check for Articles
+                    match = _ARTICLE_RE.match(line) if 'article' in folded else None
+                    if match:
+                        structure['articles'].append({
+                            'number': match.group(1) or match.group(2),
+                            'title': _MD_TOKEN_RE.sub('', match.group(3)).strip(),
+                            'position': page_number,
+                            'line': line
+                        })
+                    
+                    # Check for Schedules
+                    if _has_schedule_heading(line, folded, 0, len(line)):
+                        structure['schedules'].append({
+                            'name': line,
+                            'position': page_number
+                        })
+        finally:
+            doc.close()
+        
+        structure['parts'] = list(parts_by_number.values())
+        return structure
+    
+    def _heading_lines(self, page) -> List[str]:
+        """Return the text lines of a page set larger than its median font size."""
+        lines = []
+        for block in page.get_text("dict")["blocks"]:
+            for line in block.get("lines", []):
+                spans = line["spans"]
+                if spans:
+                    text = "".join(span["text"] for span in spans).strip()
+                    lines.append((text, max(span["size"] for span in spans)))
+        
+        if not lines:
+            return []
+        median = statistics.median(size for _, size in lines)
+        return [text for text, size in lines if text and size > median]
+    
+    def parse_many(
+        self,
+        pdf_paths: List[Path],
+        workers: Optional[int] = None
+    ) -> Dict[Path, Union[Tuple[str, dict], Exception]]:
+        """
+        Parse many PDFs with parse_pdf_to_text across a pool of worker processes.
+        
+        Args:
+            pdf_paths: Paths to PDF files
+            workers: Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            Mapping of each path to its (markdown_text, structure_dict), or to
+            the exception raised while parsing it
+        """
+        return run_in_processes(self.parse_pdf_to_text, pdf_paths, workers)
+    
+    def parse_pdf_fast(self, pdf_path: Path) -> str:
+        """
+        Extract plain text from PDF using raw PyMuPDF page extraction.
         
-        # Extract structure from markdown
-        structure = self.extract_constitution_structure(md_text)
+        Skips the markdown layout analysis done by pymupdf4llm, which the
+        regex-based document parser does not need.
         
-        return md_text, structure
+        Args:
+            pdf_path: Path to PDF file
+            
+        Returns:
+            Plain text of all pages joined by newlines
+        """
+        doc = pymupdf.open(str(pdf_path))
+        try:
+            return "\n".join(page.get_text("text") for page in doc)
+        finally:
+            doc.close()
     
     def clean_text(self, text: str) -> str:
         """
@@ -309,17 +689,25 @@ class PDFParser:
         Returns:
             Cleaned plain text
         """
+        # Each pass sees the output of the one before, so they stay in order;
+        # a pass is skipped when the text cannot contain a match for it
+        
         # Remove markdown headers
-        text = re.sub(r'^#{1,6}\s*', '', text, flags=re.MULTILINE)
+        if '#' in text:
+            text = _MD_HEADER_RE.sub('', text)
         
         # Remove emphasis markers
-        text = re.sub(r'[*_]{1,2}([^*_]+)[*_]{1,2}', r'\1', text)
+        if '*' in text or '_' in text:
+            text = _EMPHASIS_RE.sub(r'\1', text)
         
         # Remove links
-        text = re.sub(r'\[([^\]]+)\]\([^\)]+\)', r'\1', text)
+        if '](' in text:
+            text = _LINK_RE.sub(r'\1', text)
         
-        # Clean up excessive whitespace
-        text = re.sub(r'\n{3,}', '\n\n', text)
-        text = re.sub(r' +', ' ', text)
+        # Clean up excessive whitespace; single spaces are left in place
+        if '\n\n\n' in text:
+            text = _BLANK_RUN_RE.sub('\n\n', text)
+        if '  ' in text:
+            text = _SPACE_RUN_RE.sub(' ', text)
         
         return text.strip()
\ No newline at end of file
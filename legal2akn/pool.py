@@ -0,0 +1,43 @@
+"""Run per-document work across a pool of worker processes."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Optional, Union
+
+
+def run_in_processes(
+    func: Callable[..., Any],
+    paths: Iterable[Path],
+    workers: Optional[int] = None,
+    **kwargs
+) -> Dict[Path, Union[Any, Exception]]:
+    """
+    Call func on each path in parallel across a pool of worker processes.
+    
+    PyMuPDF is not safe to use from several threads, so documents are
+    spread over a process pool instead. Each worker opens its own PDF.
+    
+    Args:
+        func: Picklable callable taking a path and kwargs
+        paths: Input files
+        workers: Number of worker processes (defaults to the CPU count)
+        **kwargs: Passed to func
+    
+    Returns:
+        Mapping of each path to func's result, or to the exception raised
+        while processing it
+    """
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+        futures = {
+            Path(path): executor.submit(func, Path(path), **kwargs)
+            for path in paths
+        }
+        for path, future in futures.items():
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                results[path] = e
+    
+    return results